@@ -1,7 +1,7 @@
 """Adverse event data processor for clinical trials."""
 
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import IO, Dict, List, Tuple, Union
 
 
 class AdverseEventProcessor:
@@ -15,10 +15,20 @@ class AdverseEventProcessor:
         "description",
         "severity",
     ]
+    # Declared up front so read_csv skips type inference. Severity categories
+    # are inferred rather than fixed to SEVERITY_LEVELS so that unexpected
+    # values survive loading and fail validation.
+    COLUMN_DTYPES = {
+        "event_id": "string",
+        "patient_id": "string",
+        "event_date": "string",
+        "description": "string",
+        "severity": "category",
+    }
 
-    def load_events(self, file_path: str) -> pd.DataFrame:
-        """Load adverse events from CSV file."""
-        df = pd.read_csv(file_path)
+    def load_events(self, source: Union[str, IO[str]]) -> pd.DataFrame:
+        """Load adverse events from a CSV file path or text buffer."""
+        df = pd.read_csv(source, dtype=self.COLUMN_DTYPES)
 
         missing_cols = set(self.REQUIRED_COLUMNS) - set(df.columns)
         if missing_cols:
@@ -28,17 +38,63 @@ class AdverseEventProcessor:
 
     def validate_event(self, event: Dict) -> Tuple[bool, List[str]]:
         """Validate a single adverse event."""
-        errors = []
+        is_valid, errors = self.validate_events(pd.DataFrame([event]))
+        return bool(is_valid.iloc[0]), errors.iloc[0]
 
+    def validate_events(self, df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+        """
+        Validate all adverse events in a DataFrame column-wise.
+
+        Args:
+            df: DataFrame with one adverse event per row
+
+        Returns:
+            Tuple of (boolean validity Series, Series of error message lists)
+        """
+        errors: List[List[str]] = [[] for _ in range(len(df))]
+        has_error = pd.Series(False, index=df.index)
+
+        present = df.columns.intersection(self.REQUIRED_COLUMNS)
+        blank = df[present].isna() | (df[present] == "")
         for field in self.REQUIRED_COLUMNS:
-            if field not in event or event[field] is None or event[field] == "":
-                errors.append(f"Missing required field: {field}")
+            if field in present:
+                missing = blank[field].to_numpy(dtype=bool)
+            else:
+                missing = pd.Series(True, index=df.index).to_numpy()
+            for pos in missing.nonzero()[0]:
+                errors[pos].append(f"Missing required field: {field}")
+            has_error |= missing
+
+        if "event_date" in present:
+            event_date = df["event_date"]
+            parsed = pd.to_datetime(
+                event_date, format="ISO8601", errors="coerce", utc=True
+            )
+            invalid = (parsed.isna() & ~blank["event_date"]).to_numpy(dtype=bool)
+            date_values = event_date.to_numpy()
+            for pos in invalid.nonzero()[0]:
+                errors[pos].append(f"Invalid event_date: {date_values[pos]}")
+            has_error |= invalid
 
-        if "severity" in event and event["severity"] not in self.SEVERITY_LEVELS:
-            errors.append(f"Invalid severity: {event['severity']}")
+        if "severity" in present:
+            severity = df["severity"]
+            try:
+                labels = pd.Categorical(severity, categories=self.SEVERITY_LEVELS)
+            except TypeError:
+                # Unhashable values (e.g. lists) are never valid severities
+                labels = pd.Categorical(
+                    severity.map(lambda s: s if isinstance(s, str) else None),
+                    categories=self.SEVERITY_LEVELS,
+                )
+            invalid = labels.codes == -1
+            severity_values = severity.to_numpy()
+            for pos in invalid.nonzero()[0]:
+                errors[pos].append(f"Invalid severity: {severity_values[pos]}")
+            has_error |= invalid
 
-        return len(errors) == 0, errors
+        return ~has_error, pd.Series(errors, index=df.index, dtype=object)
 
     def categorize_by_severity(self, df: pd.DataFrame) -> Dict[str, int]:
         """Categorize events by severity level."""
-        return df["severity"].value_counts().to_dict()
+        counts = df["severity"].value_counts()
+        return counts[counts > 0].to_dict()
@@ -1,8 +1,21 @@
 """Patient demographic data validator for clinical trials."""
 
+import re
 from datetime import datetime
-from typing import Dict, List, Tuple
-import jsonschema
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Precompiled equivalents of the SCHEMA patterns for the validate_fast path
+_PATIENT_ID_MATCH = re.compile(r"PAT[0-9]{6}").fullmatch
+_SITE_ID_MATCH = re.compile(r"SITE[0-9]{3}").fullmatch
+
+
+@lru_cache(maxsize=None)
+def _get_validator():
+    """Build the schema validator on first use, importing jsonschema lazily."""
+    import jsonschema
+
+    return jsonschema.Draft7Validator(PatientValidator.SCHEMA)
 
 
 class PatientValidator:
@@ -30,29 +43,111 @@ class PatientValidator:
 
     def __init__(self):
         """Initialize validator with schema."""
-        self.validator = jsonschema.Draft7Validator(self.SCHEMA)
+        self.validator = _get_validator()
 
-    def validate(self, patient_data: Dict) -> Tuple[bool, List[str]]:
+    def validate(
+        self, patient_data: Dict, now: Optional[datetime] = None
+    ) -> Tuple[bool, List[str]]:
         """
         Validate patient demographic data.
 
         Args:
             patient_data: Dictionary containing patient information
+            now: Reference time for the future-date check (defaults to now)
 
         Returns:
             Tuple of (is_valid, list of error messages)
         """
+        if now is None:
+            now = datetime.now()
+
         errors = []
 
         # Schema validation
         for error in self.validator.iter_errors(patient_data):
             errors.append(f"{error.json_path}: {error.message}")
 
+        errors.extend(self._check_business_rules(patient_data, now))
+
+        return len(errors) == 0, errors
+
+    def validate_fast(
+        self, patient_data: Dict, now: Optional[datetime] = None
+    ) -> Tuple[bool, List[str]]:
+        """
+        Validate patient demographic data, skipping jsonschema when possible.
+
+        Records that pass plain Python checks equivalent to SCHEMA only run
+        the business rules; anything else falls back to validate() so the
+        error messages are identical.
+
+        Args:
+            patient_data: Dictionary containing patient information
+            now: Reference time for the future-date check (defaults to now)
+
+        Returns:
+            Tuple of (is_valid, list of error messages)
+        """
+        if not self._matches_schema(patient_data):
+            return self.validate(patient_data, now)
+
+        if now is None:
+            now = datetime.now()
+
+        errors = self._check_business_rules(patient_data, now)
+        return len(errors) == 0, errors
+
+    def validate_many(self, patients: Iterable[Dict]) -> List[Tuple[bool, List[str]]]:
+        """
+        Validate a batch of patient records.
+
+        Args:
+            patients: Iterable of patient dictionaries
+
+        Returns:
+            List of (is_valid, list of error messages), one per patient
+        """
+        now = datetime.now()
+        return [self.validate_fast(patient, now) for patient in patients]
+
+    @staticmethod
+    def _matches_schema(patient_data: Dict) -> bool:
+        """Return True if patient_data is certain to satisfy SCHEMA."""
+        if type(patient_data) is not dict:
+            return False
+
+        try:
+            patient_id = patient_data["patient_id"]
+            age = patient_data["age"]
+            gender = patient_data["gender"]
+            enrollment_date = patient_data["enrollment_date"]
+            site_id = patient_data["site_id"]
+            consent_signed = patient_data["consent_signed"]
+        except KeyError:
+            return False
+
+        return (
+            type(patient_id) is str
+            and _PATIENT_ID_MATCH(patient_id) is not None
+            and type(age) is int
+            and 18 <= age <= 85
+            and gender in ("M", "F", "O")
+            and type(enrollment_date) is str
+            and type(site_id) is str
+            and _SITE_ID_MATCH(site_id) is not None
+            and type(consent_signed) is bool
+        )
+
+    @staticmethod
+    def _check_business_rules(patient_data: Dict, now: datetime) -> List[str]:
+        """Apply the validations that SCHEMA cannot express."""
+        errors = []
+
         # Business rule validations
         if "enrollment_date" in patient_data:
             try:
                 enrollment = datetime.fromisoformat(patient_data["enrollment_date"])
-                if enrollment > datetime.now():
+                if enrollment > now:
                     errors.append("enrollment_date: Cannot be in the future")
             except ValueError:
                 errors.append("enrollment_date: Invalid date format")
@@ -61,4 +156,4 @@ class PatientValidator:
         if patient_data.get("consent_signed") is False:
             errors.append("consent_signed: Patient must have signed consent")
 
-        return len(errors) == 0, errors
+        return errors
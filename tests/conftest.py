@@ -0,0 +1,46 @@
+"""Shared fixtures for the test suite."""
+
+import os
+import pandas as pd
+import pytest
+from src.clinical.adverse_event_processor import AdverseEventProcessor
+from src.clinical.patient_validator import PatientValidator
+
+
+@pytest.fixture(scope="session")
+def processor():
+    """Fixture providing AdverseEventProcessor instance."""
+    return AdverseEventProcessor()
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """Fixture providing PatientValidator instance."""
+    return PatientValidator()
+
+
+@pytest.fixture(scope="session")
+def adverse_events_csv():
+    """Fixture providing the sample adverse event CSV, skipping if absent."""
+    test_file = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "test_data",
+        "adverse_events_test.csv",
+    )
+    if not os.path.exists(test_file):
+        pytest.skip(f"fixture CSV not present: {test_file}")
+    return test_file
+
+
+@pytest.fixture(scope="session")
+def severity_sample_df():
+    """Fixture providing a small adverse event DataFrame for aggregation tests."""
+    return pd.DataFrame(
+        {
+            "event_id": ["AE001", "AE002", "AE003"],
+            "patient_id": ["PAT001", "PAT002", "PAT003"],
+            "event_date": ["2024-01-20", "2024-01-21", "2024-01-22"],
+            "description": ["Headache", "Nausea", "Dizziness"],
+            "severity": ["Mild", "Moderate", "Mild"],
+        }
+    )
@@ -1,88 +1,134 @@
 """Test suite for AdverseEventProcessor."""
 
-import os
+import io
 import pytest
 import pandas as pd
-from src.clinical.adverse_event_processor import AdverseEventProcessor
 
 
-@pytest.fixture
-def processor():
-    """Fixture providing AdverseEventProcessor instance."""
-    return AdverseEventProcessor()
-
-
-def test_validate_valid_event(processor):
-    """Test validation of valid adverse event."""
-    event = {
-        "event_id": "AE001",
-        "patient_id": "PAT000001",
-        "event_date": "2024-01-20",
-        "description": "Headache",
-        "severity": "Mild",
-    }
-    is_valid, errors = processor.validate_event(event)
-    assert is_valid is True
-    assert errors == []
-
-
-def test_validate_invalid_severity(processor):
-    """Test validation with invalid severity."""
-    event = {
-        "event_id": "AE001",
-        "patient_id": "PAT000001",
-        "event_date": "2024-01-20",
-        "description": "Headache",
-        "severity": "Invalid",
-    }
+VALID_EVENT = {
+    "event_id": "AE001",
+    "patient_id": "PAT000001",
+    "event_date": "2024-01-20",
+    "description": "Headache",
+    "severity": "Mild",
+}
+
+
+@pytest.mark.parametrize(
+    "severity,missing_keys,expected_valid",
+    [
+        ("Mild", (), True),
+        ("Invalid", (), False),
+        ("Mild", ("patient_id", "event_date", "description"), False),
+    ],
+    ids=["valid", "invalid_severity", "missing_fields"],
+)
+def test_validate_event(processor, severity, missing_keys, expected_valid):
+    """Test validation of single adverse events."""
+    event = {k: v for k, v in VALID_EVENT.items() if k not in missing_keys}
+    event["severity"] = severity
     is_valid, errors = processor.validate_event(event)
-    assert is_valid is False
+    assert is_valid is expected_valid
+    assert (errors == []) is expected_valid
 
 
-def test_validate_missing_required_fields(processor):
-    """Test validation with missing required fields."""
-    event = {"event_id": "AE001", "severity": "Mild"}
+def test_validate_event_unhashable_severity(processor):
+    """Test a non-string severity is reported as invalid rather than raising."""
+    event = {**VALID_EVENT, "severity": ["Mild"]}
     is_valid, errors = processor.validate_event(event)
     assert is_valid is False
-    assert len(errors) > 0
+    assert errors == ["Invalid severity: ['Mild']"]
 
 
-def test_load_events_valid_file(processor):
+def test_load_events_valid_file(processor, adverse_events_csv):
     """Test loading events from valid CSV file."""
-    test_file = "test_data/adverse_events_test.csv"
-    if os.path.exists(test_file):
-        df = processor.load_events(test_file)
-        assert not df.empty
-        assert all(col in df.columns for col in processor.REQUIRED_COLUMNS)
+    df = processor.load_events(adverse_events_csv)
+    assert not df.empty
+    assert all(col in df.columns for col in processor.REQUIRED_COLUMNS)
 
 
 def test_load_events_missing_columns(processor):
     """Test loading events with missing required columns."""
-    import tempfile
+    buf = io.StringIO("event_id,description\nAE001,Headache\n")
+    with pytest.raises(ValueError, match="Missing required columns"):
+        processor.load_events(buf)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-        f.write("event_id,description\n")
-        f.write("AE001,Headache\n")
-        temp_file = f.name
 
-    try:
-        with pytest.raises(ValueError, match="Missing required columns"):
-            processor.load_events(temp_file)
-    finally:
-        os.unlink(temp_file)
+def test_categorize_by_severity(processor, severity_sample_df):
+    """Test categorizing events by severity."""
+    result = processor.categorize_by_severity(severity_sample_df)
+    assert result["Mild"] == 2
+    assert result["Moderate"] == 1
 
 
-def test_categorize_by_severity(processor):
-    """Test categorizing events by severity."""
+def test_validate_events_batch(processor):
+    """Test column-wise validation of multiple adverse events."""
     df = pd.DataFrame(
         {
-            "event_id": ["AE001", "AE002", "AE003"],
-            "patient_id": ["PAT001", "PAT002", "PAT003"],
-            "event_date": ["2024-01-20", "2024-01-21", "2024-01-22"],
-            "description": ["Headache", "Nausea", "Dizziness"],
-            "severity": ["Mild", "Moderate", "Mild"],
+            "event_id": ["AE001", "AE002", "AE003", "AE004", "AE005"],
+            "patient_id": ["PAT000001", "", "PAT000003", "PAT000004", "PAT000005"],
+            "event_date": [
+                "2024-01-20",
+                "2024-01-21",
+                "2024-01-22",
+                "yesterday",
+                "2024-01-23T10:00:00+02:00",
+            ],
+            "description": ["Headache", "Nausea", "Dizziness", "Fatigue", "Rash"],
+            "severity": ["Mild", "Moderate", "Invalid", "Mild", "Mild"],
         }
     )
-    result = processor.categorize_by_severity(df)
-    assert result["Mild"] == 2
-    assert result["Moderate"] == 1
+    is_valid, errors = processor.validate_events(df)
+    assert is_valid.tolist() == [True, False, False, False, True]
+    assert errors.tolist() == [
+        [],
+        ["Missing required field: patient_id"],
+        ["Invalid severity: Invalid"],
+        ["Invalid event_date: yesterday"],
+        [],
+    ]
+
+
+def test_validate_events_reports_each_invalid_row(processor):
+    """Test every invalid row gets its own error message in one batch."""
+    df = pd.DataFrame([VALID_EVENT] * 4)
+    df["severity"] = ["Bad", "Mild", "Worse", None]
+    df["event_date"] = ["2024-01-20", "2024-13-01", "2024-01-22", "soon"]
+    is_valid, errors = processor.validate_events(df)
+    assert is_valid.tolist() == [False, False, False, False]
+    assert errors.tolist() == [
+        ["Invalid severity: Bad"],
+        ["Invalid event_date: 2024-13-01"],
+        ["Invalid severity: Worse"],
+        [
+            "Missing required field: severity",
+            "Invalid event_date: soon",
+            "Invalid severity: None",
+        ],
+    ]
+
+
+def test_load_events_categorical_severity(processor):
+    """Test severity is loaded as a categorical without dropping values."""
+    buf = io.StringIO(
+        "event_id,patient_id,event_date,description,severity\n"
+        "AE001,PAT000001,2024-01-20,Headache,Mild\n"
+        "AE002,PAT000002,2024-01-21,Nausea,Unknown\n"
+    )
+    df = processor.load_events(buf)
+    assert isinstance(df["severity"].dtype, pd.CategoricalDtype)
+    assert processor.categorize_by_severity(df) == {"Mild": 1, "Unknown": 1}
+    assert processor.categorize_by_severity(df.iloc[:1]) == {"Mild": 1}
+
+
+def test_load_events_validates_loaded_frame(processor):
+    """Test events loaded with declared dtypes can be validated column-wise."""
+    buf = io.StringIO(
+        "event_id,patient_id,event_date,description,severity\n"
+        "AE001,PAT000001,2024-01-20,Headache,Mild\n"
+        "AE002,,2024-01-21,Nausea,Moderate\n"
+    )
+    df = processor.load_events(buf)
+    assert df["patient_id"].dtype == "string"
+    is_valid, _ = processor.validate_events(df)
+    assert is_valid.tolist() == [True, False]
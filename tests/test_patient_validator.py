@@ -1,55 +1,43 @@
 """Test suite for PatientValidator."""
 
 import pytest
-from src.clinical.patient_validator import PatientValidator
+from types import MappingProxyType
 
 
-@pytest.fixture
-def validator():
-    """Fixture providing PatientValidator instance."""
-    return PatientValidator()
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_patient():
-    """Fixture providing valid patient data."""
-    return {
-        "patient_id": "PAT000001",
-        "age": 45,
-        "gender": "F",
-        "enrollment_date": "2024-01-15",
-        "site_id": "SITE001",
-        "consent_signed": True,
-    }
-
-
-def test_valid_patient(validator, valid_patient):
-    """Test validation of valid patient data."""
-    is_valid, errors = validator.validate(valid_patient)
-    assert is_valid is True
-    assert errors == []
-
-
-def test_invalid_patient_id(validator, valid_patient):
-    """Test invalid patient ID format."""
-    valid_patient["patient_id"] = "INVALID"
-    is_valid, errors = validator.validate(valid_patient)
-    assert is_valid is False
-    assert any("patient_id" in error for error in errors)
-
-
-def test_age_below_minimum(validator, valid_patient):
-    """Test age below minimum threshold."""
-    valid_patient["age"] = 15
-    is_valid, errors = validator.validate(valid_patient)
-    assert is_valid is False
-
-
-def test_unsigned_consent(validator, valid_patient):
-    """Test unsigned consent."""
-    valid_patient["consent_signed"] = False
-    is_valid, errors = validator.validate(valid_patient)
-    assert is_valid is False
+    """Fixture providing read-only valid patient data; copy it to modify."""
+    return MappingProxyType(
+        {
+            "patient_id": "PAT000001",
+            "age": 45,
+            "gender": "F",
+            "enrollment_date": "2024-01-15",
+            "site_id": "SITE001",
+            "consent_signed": True,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "mutation,expected_valid,expected_field",
+    [
+        ({}, True, None),
+        ({"patient_id": "INVALID"}, False, "patient_id"),
+        ({"age": 15}, False, "age"),
+        ({"consent_signed": False}, False, "consent_signed"),
+    ],
+    ids=["valid", "bad_id", "young", "unsigned"],
+)
+def test_validate(validator, valid_patient, mutation, expected_valid, expected_field):
+    """Test validation of valid and invalid patient data."""
+    patient = {**valid_patient, **mutation}
+    is_valid, errors = validator.validate(patient)
+    assert is_valid is expected_valid
+    if expected_field is None:
+        assert errors == []
+    else:
+        assert any(expected_field in error for error in errors)
 
 
 def test_future_enrollment_date(validator, valid_patient):
@@ -57,7 +45,33 @@ def test_future_enrollment_date(validator, valid_patient):
     from datetime import datetime, timedelta
 
     future_date = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
-    valid_patient["enrollment_date"] = future_date
-    is_valid, errors = validator.validate(valid_patient)
+    patient = {**valid_patient, "enrollment_date": future_date}
+    is_valid, errors = validator.validate(patient)
     assert is_valid is False
     assert any("future" in error.lower() for error in errors)
+
+
+def test_validate_many(validator, valid_patient):
+    """Test batch validation returns one result per patient."""
+    patients = [{**valid_patient}, {**valid_patient, "age": 15}]
+    results = validator.validate_many(patients)
+    assert [is_valid for is_valid, _ in results] == [True, False]
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"patient_id": "INVALID"},
+        {"age": 15},
+        {"age": 45.0},
+        {"gender": "X"},
+        {"site_id": "SITE1"},
+        {"consent_signed": False},
+        {"enrollment_date": "not-a-date"},
+    ],
+)
+def test_validate_fast_matches_validate(validator, valid_patient, overrides):
+    """Test the fast path returns the same result as full validation."""
+    patient = {**valid_patient, **overrides}
+    assert validator.validate_fast(patient) == validator.validate(patient)